@@ -1,29 +1,120 @@
-import openmeteo_requests
 import pandas as pd
 import numpy as np
-import requests_cache
-from retry_requests import retry
-from dash import Dash, html, dcc, Input, Output
-import plotly.express as px
-import plotly.graph_objects as go
+from dash import Dash, html, dcc, Input, Output, State, Patch, ctx
+from dash.exceptions import PreventUpdate
 from datetime import date, timedelta
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
+import base64
+import io
 import os
-import glob
+import threading
+import time
+import uuid
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Set pandas display option for 2 decimal float precision
 pd.set_option("display.float_format", "{:.2f}".format)
 
-# Setup the Open-Meteo API client with cache and retry on error
-cache_session = requests_cache.CachedSession(".cache", expire_after=3600)
-retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
-openmeteo = openmeteo_requests.Client(session=retry_session)
+
+@lru_cache(maxsize=1)
+def _get_openmeteo_client():
+    """
+    Setup the Open-Meteo API client with cache and retry on error.
+
+    Built on first use so runs that only touch the data files skip the
+    HTTP stack. Responses are cached in SQLite for an hour; only GET
+    requests are cached. requests already advertises gzip/deflate (and
+    br/zstd when installed), so the Accept-Encoding header is left at its
+    default.
+    """
+    import openmeteo_requests
+    import requests_cache
+    from retry_requests import retry
+
+    cache_session = requests_cache.CachedSession(
+        ".cache", backend="sqlite", expire_after=3600, allowable_methods=["GET"]
+    )
+    retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
+    return openmeteo_requests.Client(session=retry_session)
+
+
+# Background pool for data file writes so callbacks don't wait on disk
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Daily variables requested from Open-Meteo, in response order
+DAILY_VARIABLES = [
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "temperature_2m_mean",
+    "wind_speed_10m_mean",
+    "wind_speed_10m_min",
+    "wind_speed_10m_max",
+    "relative_humidity_2m_mean",
+    "relative_humidity_2m_max",
+    "relative_humidity_2m_min",
+    "precipitation_sum",
+    "rain_sum",
+]
+
+# Hourly variables requested from Open-Meteo, in response order
+HOURLY_VARIABLES = [
+    "temperature_2m",
+]
 
 
 # FUNCTION TO GET THE DATA
 
 
+def _variables_as_block(section, n_rows):
+    """
+    Copy every variable of an Open-Meteo response section into one array.
+
+    The block is column-major float32 so a DataFrame can wrap it without a
+    consolidation copy. float32 is ample for these readings; rounding
+    happens when displayed.
+
+    Args:
+        section: Daily or hourly section of an Open-Meteo response
+        n_rows (int): Number of time steps in the section
+
+    Returns:
+        numpy.ndarray: (n_rows, n_variables) array of values
+    """
+    n_variables = section.VariablesLength()
+    block = np.empty((n_rows, n_variables), dtype=np.float32, order="F")
+    variables = section.Variables
+    for i in range(n_variables):
+        block[:, i] = variables(i).ValuesAsNumpy()
+    return block
+
+
+def _write_frames(*frames_and_paths):
+    """
+    Write (frame, path) pairs to Parquet data files as one unit.
+
+    Each frame goes to a temporary file first, and the files are only moved
+    into place with os.replace once every write has succeeded, so a failure
+    never leaves a partial file or half of a daily/hourly pair behind.
+    Errors are logged rather than raised.
+    """
+    written = []
+    try:
+        for frame, path in frames_and_paths:
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            written.append((tmp_path, path))
+            frame.to_parquet(tmp_path, engine="pyarrow", compression="snappy")
+        for tmp_path, path in written:
+            os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error writing data files: {e}")
+        for tmp_path, _ in written:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
 def get_weather_data(latitude=38.2542, longitude=-85.7594, unit_system="imperial"):
     """
     Fetch weather data from Open-Meteo API for the specified location.
@@ -48,22 +139,8 @@ def get_weather_data(latitude=38.2542, longitude=-85.7594, unit_system="imperial
     params = {
         "latitude": latitude,
         "longitude": longitude,
-        "daily": [
-            "temperature_2m_max",
-            "temperature_2m_min",
-            "temperature_2m_mean",
-            "wind_speed_10m_mean",
-            "wind_speed_10m_min",
-            "wind_speed_10m_max",
-            "relative_humidity_2m_mean",
-            "relative_humidity_2m_max",
-            "relative_humidity_2m_min",
-            "precipitation_sum",
-            "rain_sum",
-        ],
-        "hourly": [
-            "temperature_2m",
-        ],
+        "daily": DAILY_VARIABLES,
+        "hourly": HOURLY_VARIABLES,
         "timezone": "America/New_York",
         "past_days": 31,
         "wind_speed_unit": wind_unit,
@@ -73,70 +150,33 @@ def get_weather_data(latitude=38.2542, longitude=-85.7594, unit_system="imperial
 
     print("Fetching daily weather data from Open-Meteo API...")
     try:
-        responses = openmeteo.weather_api(url, params=params)
+        responses = _get_openmeteo_client().weather_api(url, params=params)
         response = responses[0]
         print("Data fetched successfully.")
 
         daily = response.Daily()
-        daily_data = {
-            "date": pd.date_range(
-                start=pd.to_datetime(daily.Time(), unit="s", utc=True),
-                end=pd.to_datetime(daily.TimeEnd(), unit="s", utc=True),
-                freq=pd.Timedelta(seconds=daily.Interval()),
-                inclusive="left",
-            ).date
-        }
-
-        # Assign values with rounding
-        daily_data["temperature_2m_max"] = np.round(
-            daily.Variables(0).ValuesAsNumpy(), 2
-        )
-        daily_data["temperature_2m_min"] = np.round(
-            daily.Variables(1).ValuesAsNumpy(), 2
-        )
-        daily_data["temperature_2m_mean"] = np.round(
-            daily.Variables(2).ValuesAsNumpy(), 2
-        )
-        daily_data["wind_speed_10m_mean"] = np.round(
-            daily.Variables(3).ValuesAsNumpy(), 2
+        daily_dates = pd.date_range(
+            start=pd.to_datetime(daily.Time(), unit="s", utc=True),
+            end=pd.to_datetime(daily.TimeEnd(), unit="s", utc=True),
+            freq=pd.Timedelta(seconds=daily.Interval()),
+            inclusive="left",
+        ).date
+        daily_dataframe = pd.DataFrame(
+            _variables_as_block(daily, len(daily_dates)), columns=DAILY_VARIABLES
         )
-        daily_data["wind_speed_10m_min"] = np.round(
-            daily.Variables(4).ValuesAsNumpy(), 2
-        )
-        daily_data["wind_speed_10m_max"] = np.round(
-            daily.Variables(5).ValuesAsNumpy(), 2
-        )
-        daily_data["relative_humidity_2m_mean"] = np.round(
-            daily.Variables(6).ValuesAsNumpy(), 2
-        )
-        daily_data["relative_humidity_2m_max"] = np.round(
-            daily.Variables(7).ValuesAsNumpy(), 2
-        )
-        daily_data["relative_humidity_2m_min"] = np.round(
-            daily.Variables(8).ValuesAsNumpy(), 2
-        )
-        daily_data["precipitation_sum"] = np.round(
-            daily.Variables(9).ValuesAsNumpy(), 2
-        )
-        daily_data["rain_sum"] = np.round(daily.Variables(10).ValuesAsNumpy(), 2)
-
-        daily_dataframe = pd.DataFrame(data=daily_data)
+        daily_dataframe.insert(0, "date", pd.to_datetime(daily_dates))
 
         hourly = response.Hourly()
-        hourly_data = {
-            "date": pd.date_range(
-                start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-                end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-                freq=pd.Timedelta(seconds=hourly.Interval()),
-                inclusive="left",
-            )
-        }
-        hourly_data["temperature_2m"] = hourly.Variables(0).ValuesAsNumpy()
-        hourly_dataframe = pd.DataFrame(data=hourly_data)
-        
-        # Save files with unit system in filename
-        hourly_dataframe.to_csv(f"{unit_system}_hourly_data_{today}.csv", index=False)
-        daily_dataframe.to_csv(f"{unit_system}_daily_data_{today}.csv", index=False)
+        hourly_dates = pd.date_range(
+            start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
+            end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
+            freq=pd.Timedelta(seconds=hourly.Interval()),
+            inclusive="left",
+        )
+        hourly_dataframe = pd.DataFrame(
+            _variables_as_block(hourly, len(hourly_dates)), columns=HOURLY_VARIABLES
+        )
+        hourly_dataframe.insert(0, "date", hourly_dates)
 
     except Exception as e:
         print(f"Error fetching data: {e}")
@@ -161,81 +201,189 @@ def get_weather_data(latitude=38.2542, longitude=-85.7594, unit_system="imperial
             
         dummy_data = {
             "date": dates,
-            "temperature_2m_max": np.random.uniform(temp_max_range[0], temp_max_range[1], len(dates)),
-            "temperature_2m_min": np.random.uniform(temp_min_range[0], temp_min_range[1], len(dates)),
-            "temperature_2m_mean": np.random.uniform(temp_mean_range[0], temp_mean_range[1], len(dates)),
-            "wind_speed_10m_mean": np.random.uniform(wind_range[0], wind_range[1], len(dates)),
-            "wind_speed_10m_min": np.random.uniform(0, wind_range[0], len(dates)),
-            "wind_speed_10m_max": np.random.uniform(wind_range[0], wind_range[1] * 1.5, len(dates)),
-            "relative_humidity_2m_mean": np.random.uniform(60, 90, len(dates)),
-            "relative_humidity_2m_max": np.random.uniform(70, 100, len(dates)),
-            "relative_humidity_2m_min": np.random.uniform(40, 70, len(dates)),
-            "precipitation_sum": np.random.uniform(0, precip_range[1], len(dates)),
-            "rain_sum": np.random.uniform(0, precip_range[1] * 0.8, len(dates)),
+            "temperature_2m_max": np.random.uniform(temp_max_range[0], temp_max_range[1], len(dates)).astype(np.float32),
+            "temperature_2m_min": np.random.uniform(temp_min_range[0], temp_min_range[1], len(dates)).astype(np.float32),
+            "temperature_2m_mean": np.random.uniform(temp_mean_range[0], temp_mean_range[1], len(dates)).astype(np.float32),
+            "wind_speed_10m_mean": np.random.uniform(wind_range[0], wind_range[1], len(dates)).astype(np.float32),
+            "wind_speed_10m_min": np.random.uniform(0, wind_range[0], len(dates)).astype(np.float32),
+            "wind_speed_10m_max": np.random.uniform(wind_range[0], wind_range[1] * 1.5, len(dates)).astype(np.float32),
+            "relative_humidity_2m_mean": np.random.uniform(60, 90, len(dates)).astype(np.float32),
+            "relative_humidity_2m_max": np.random.uniform(70, 100, len(dates)).astype(np.float32),
+            "relative_humidity_2m_min": np.random.uniform(40, 70, len(dates)).astype(np.float32),
+            "precipitation_sum": np.random.uniform(0, precip_range[1], len(dates)).astype(np.float32),
+            "rain_sum": np.random.uniform(0, precip_range[1] * 0.8, len(dates)).astype(np.float32),
         }
         daily_dataframe = pd.DataFrame(dummy_data)
         daily_dataframe["date"] = pd.to_datetime(daily_dataframe["date"])
 
-        # Save dummy data with unit system in filename
-        daily_dataframe.to_csv(f"{unit_system}_daily_data_{today}.csv", index=False)
+        hourly_dates = pd.date_range(
+            start=pd.Timestamp(today - timedelta(days=31)),
+            end=pd.Timestamp(today + timedelta(days=7)),
+            freq="h",
+            tz="UTC",
+            inclusive="left",
+        )
+        hourly_dataframe = pd.DataFrame(
+            {
+                "date": hourly_dates,
+                "temperature_2m": np.random.uniform(
+                    temp_min_range[0], temp_max_range[1], len(hourly_dates)
+                ).astype(np.float32),
+            }
+        )
+    else:
+        # Save both files with unit system in filename, in the background.
+        # Dummy frames are never saved: they live only in the in-memory
+        # cache, so other workers and later restarts retry the API.
+        _IO_POOL.submit(
+            _write_frames,
+            (daily_dataframe, f"{unit_system}_daily_data_{today}.parquet"),
+            (hourly_dataframe, f"{unit_system}_hourly_data_{today}.parquet"),
+        )
 
     return daily_dataframe, hourly_dataframe
 
 
+# Name prefixes of the per-unit daily and hourly data files
+DATA_FILE_PREFIXES = (
+    "imperial_daily_data_",
+    "imperial_hourly_data_",
+    "metric_daily_data_",
+    "metric_hourly_data_",
+)
+
+
 # Add this function after the imports
 def cleanup_old_data_files():
-    """Delete CSV files older than today."""
-    today = datetime.now().date()
-
-    # Delete daily data files for both unit systems
-    for unit in ['imperial', 'metric']:
-        daily_files = glob.glob(f"{unit}_daily_data_*.csv")
-        for file in daily_files:
-            try:
-                file_date = datetime.strptime(
-                    file.split("_")[3].split(".")[0], "%Y-%m-%d"
-                ).date()
-                if file_date < today:
-                    os.remove(file)
-                    print(f"Deleted old file: {file}")
-            except Exception as e:
-                print(f"Error processing file {file}: {e}")
-
-        # Delete hourly data files
-        hourly_files = glob.glob(f"{unit}_hourly_data_*.csv")
-        for file in hourly_files:
-            try:
-                file_date = datetime.strptime(
-                    file.split("_")[3].split(".")[0], "%Y-%m-%d"
-                ).date()
-                if file_date < today:
-                    os.remove(file)
-                    print(f"Deleted old file: {file}")
-            except Exception as e:
-                print(f"Error processing file {file}: {e}")
+    """Delete data files older than today."""
+    # File names end in an ISO date, so string comparison orders them by day
+    today_str = datetime.now().date().isoformat()
+
+    # Single pass over the directory for both unit systems and frequencies
+    with os.scandir(".") as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".parquet") or not name.startswith(DATA_FILE_PREFIXES):
+                continue
+            if name[-len("YYYY-MM-DD.parquet"):-len(".parquet")] < today_str:
+                try:
+                    os.remove(entry.path)
+                    print(f"Deleted old file: {name}")
+                except Exception as e:
+                    print(f"Error processing file {name}: {e}")
+
+
+# ---------- IN-PROCESS DATA CACHE ---------- #
+# Parsed frames are kept in memory for the same hour the HTTP cache uses, so
+# callbacks never re-read the day files.
+CACHE_TTL_SECONDS = 3600
+_DF_CACHE: dict[tuple[str, date], tuple[pd.DataFrame, pd.DataFrame]] = {}
+_CACHE_EXPIRY: dict[tuple[str, date], float] = {}
+# Guards the dicts above and _KEY_LOCKS; only held for dict updates
+_CACHE_LOCK = threading.Lock()
+# One lock per cache key, so concurrent misses for the same unit system and
+# day call the API once while other keys stay available
+_KEY_LOCKS: dict[tuple[str, date], threading.Lock] = {}
+
+
+def _is_fresh(key):
+    """Return True if the in-memory cache holds an unexpired entry for key."""
+    return key in _DF_CACHE and time.time() < _CACHE_EXPIRY.get(key, 0)
+
+
+def _index_by_day(daily_dataframe):
+    """Return the daily frame indexed by calendar day, keeping the date column."""
+    return daily_dataframe.set_index(
+        pd.DatetimeIndex(daily_dataframe["date"]).date, drop=False
+    )
+
+
+def get_cached_frames(unit_system="imperial"):
+    """
+    Return today's weather frames for a unit system, reusing parsed copies.
+
+    Checks the in-memory cache first, then today's data files on disk, and
+    only calls the Open-Meteo API when neither is available or the in-memory
+    entry has expired.
+
+    Args:
+        unit_system (str): Unit system ('imperial' or 'metric')
+
+    Returns:
+        tuple: (daily_dataframe, hourly_dataframe) with parsed date columns;
+            daily rows are indexed by calendar day and hourly rows carry a
+            `_day_key` day number
+    """
+    today = date.today()
+    key = (unit_system, today)
+    cached = _DF_CACHE.get(key)
+    if cached is not None and _is_fresh(key):
+        return cached
+
+    with _CACHE_LOCK:
+        key_lock = _KEY_LOCKS.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another thread may have filled the entry while this one waited
+        cached = _DF_CACHE.get(key)
+        if cached is not None and _is_fresh(key):
+            return cached
+
+        daily_file = f"{unit_system}_daily_data_{today}.parquet"
+        hourly_file = f"{unit_system}_hourly_data_{today}.parquet"
+        if cached is None and os.path.exists(daily_file) and os.path.exists(hourly_file):
+            print(f"Loading {unit_system} data from cache...")
+            daily_dataframe = pd.read_parquet(daily_file, engine="pyarrow")
+            hourly_dataframe = pd.read_parquet(hourly_file, engine="pyarrow")
+        else:
+            print(f"Fetching data for {unit_system} units...")
+            daily_dataframe, hourly_dataframe = get_weather_data(unit_system=unit_system)
+            _IO_POOL.submit(cleanup_old_data_files)
+
+        # Index daily rows by calendar day so callbacks can look days up directly,
+        # and tag hourly rows with an integer day number for cheap day filters
+        daily_dataframe = _index_by_day(daily_dataframe)
+        hourly_dataframe = hourly_dataframe.assign(
+            _day_key=hourly_dataframe["date"].values.astype("datetime64[D]").view("int64")
+        )
+        frames = (daily_dataframe, hourly_dataframe)
+
+        with _CACHE_LOCK:
+            # Drop entries left over from previous days
+            for stale_key in [k for k in _DF_CACHE if k[1] != today]:
+                _DF_CACHE.pop(stale_key, None)
+                _CACHE_EXPIRY.pop(stale_key, None)
+            for stale_key in [k for k in _KEY_LOCKS if k[1] != today]:
+                _KEY_LOCKS.pop(stale_key, None)
+
+            _DF_CACHE[key] = frames
+            _CACHE_EXPIRY[key] = time.time() + CACHE_TTL_SECONDS
+        return frames
+
+
+def _filter_day(frame, day):
+    """Return the hourly rows that fall on the given calendar day."""
+    return frame[frame["_day_key"].to_numpy() == np.datetime64(day, "D").astype("int64")]
+
+
+def _display_values(series):
+    """
+    Return a column as float64 rounded to the 2 decimals the charts display.
+
+    plotly's json engine writes float32 values at full double precision
+    (72.35 becomes 72.3499984741211), so display payloads are widened and
+    rounded first to keep them short.
+    """
+    return np.round(series.to_numpy(dtype=np.float64), 2)
 
 
 # ---------- LOAD OR FETCH DATA ---------- #
 today = date.today()
-if os.path.exists(f"daily_data_{today}.csv") and os.path.exists(
-    f"hourly_data_{today}.csv"
-):
-    print("Loading daily data from cache...")
-    daily_dataframe = pd.read_csv(f"daily_data_{today}.csv")
-    daily_dataframe["date"] = pd.to_datetime(daily_dataframe["date"])
-    hourly_dataframe = pd.read_csv(f"hourly_data_{today}.csv")
-    hourly_dataframe["date"] = pd.to_datetime(hourly_dataframe["date"])
-else:
-    print("Fetching daily data from Open-Meteo API...")
-    daily_dataframe, hourly_dataframe = get_weather_data()
-    daily_dataframe["date"] = pd.to_datetime(daily_dataframe["date"])
-    hourly_dataframe["date"] = pd.to_datetime(hourly_dataframe["date"])
-    cleanup_old_data_files()
-
-
-unique_days = hourly_dataframe[
-    hourly_dataframe["date"].dt.date >= pd.to_datetime(today).date()
-]["date"].dt.date.unique()
+daily_dataframe, hourly_dataframe = get_cached_frames("imperial")
+
+# First seven days from today onward, kept as datetime64[D] (no date objects)
+hourly_days = hourly_dataframe["_day_key"].to_numpy().view("datetime64[D]")
+unique_days = np.unique(hourly_days[hourly_days >= np.datetime64(today, "D")])[:7]
 
 
 def create_hourly_graphs(selected_date):
@@ -248,19 +396,23 @@ def create_hourly_graphs(selected_date):
     Returns:
         plotly.graph_objects.Figure: The hourly temperature graph
     """
-    filtered = hourly_dataframe[hourly_dataframe["date"].dt.date == selected_date]
-    fig_temp = px.line(
-        filtered,
-        x="date",
-        y="temperature_2m",
-        labels={
-            "temperature_2m": "Temperature (°F)",
-            "date": "Time",
-            "variable": "Metric",
-        },
+    import plotly.graph_objects as go
+
+    filtered = _filter_day(hourly_dataframe, selected_date)
+    fig_temp = go.Figure(
+        go.Scatter(
+            x=filtered["date"].values.astype("datetime64[ms]"),
+            y=_display_values(filtered["temperature_2m"]),
+            mode="lines",
+            line=dict(color="#8dd3c7"),
+        )
+    )
+    fig_temp.update_layout(
+        xaxis_title="Time",
+        yaxis_title="Temperature (°F)",
+        yaxis_hoverformat=".2f",
         template="plotly_dark",
         title=f"Hourly Temperature – {selected_date}",
-        color_discrete_sequence=px.colors.qualitative.Set3,
     )
     return fig_temp
 
@@ -275,6 +427,12 @@ app = Dash(__name__, external_stylesheets=external_stylesheets)
 server = app.server
 app.title = "Weather Dashboard"
 
+# Cache for rendered figures, shared by every worker on this machine
+cache = Cache(
+    server,
+    config={"CACHE_TYPE": "FileSystemCache", "CACHE_DIR": ".flask_cache"},
+)
+
 
 # --- 3. Define the Layout of the Dashboard ---
 app.layout = html.Div(
@@ -380,6 +538,8 @@ app.layout = html.Div(
                 html.Br(),
                 # Add unit system state
                 dcc.Store(id='unit-system-store', data='imperial'),
+                # Daily data for the selected unit system, shared by callbacks
+                dcc.Store(id='daily-data-store'),
 
                 # Add radio button after the date picker
                 html.Div(
@@ -570,7 +730,7 @@ app.layout = html.Div(
                                         'borderTop': '3px solid #2196F3'
                                     }
                                 )
-                                for day in unique_days[:7]
+                                for day in unique_days.tolist()
                             ],
                             style={'marginBottom': '20px'}
                         ),
@@ -618,6 +778,22 @@ app.layout = html.Div(
 # --- 4. Implement Callbacks for Interactivity ---
 
 
+# Unit-dependent labels, built once instead of formatted on every callback
+LABELS = {
+    unit_system: {
+        "temp": temp_unit,
+        "temp_axis": f"Temperature ({temp_unit})",
+        "wind_axis": f"Wind Speed ({wind_unit})",
+        "max_temp": f"Max Temp ({temp_unit})",
+        "max_wind": f"Max Wind ({wind_unit})",
+    }
+    for unit_system, temp_unit, wind_unit in (
+        ("imperial", "°F", "mph"),
+        ("metric", "°C", "km/h"),
+    )
+}
+
+
 # Callbacks
 @app.callback(Output("hourly-tab-content", "children"), 
              [Input("hourly-tabs", "value"),
@@ -633,37 +809,31 @@ def update_hourly_graphs(selected_date, unit_system):
     Returns:
         dash.html.Div: The updated hourly temperature graph
     """
+    import plotly.graph_objects as go
+
     selected = pd.to_datetime(selected_date).date()
-    
-    # Get the correct temperature unit label
-    temp_unit = "°F" if unit_system == "imperial" else "°C"
-    
-    # Load the correct data file
-    if not os.path.exists(f"{unit_system}_hourly_data_{today}.csv"):
-        print(f"Fetching data for {unit_system} units...")
-        _, hourly_dataframe = get_weather_data(unit_system=unit_system)
-    else:
-        print(f"Loading {unit_system} hourly data from cache...")
-        hourly_dataframe = pd.read_csv(f"{unit_system}_hourly_data_{today}.csv")
-        hourly_dataframe["date"] = pd.to_datetime(hourly_dataframe["date"])
+    labels = LABELS[unit_system]
 
-    filtered = hourly_dataframe[hourly_dataframe["date"].dt.date == selected]
+    _, hourly_dataframe = get_cached_frames(unit_system)
+
+    filtered = _filter_day(hourly_dataframe, selected)
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=filtered["date"],
-            y=filtered["temperature_2m"],
+            x=filtered["date"].values.astype("datetime64[ms]"),
+            y=_display_values(filtered["temperature_2m"]),
             mode="lines+markers",
-            name=f"Temperature ({temp_unit})",
+            name=labels["temp_axis"],
             line=dict(color="red"),
         )
     )
     
     fig.update_layout(
         xaxis_title="Time",
-        yaxis_title=f"Temperature ({temp_unit})",
+        yaxis_title=labels["temp_axis"],
+        yaxis_hoverformat=".2f",
         template="plotly_dark",
-        title=f"Hourly Temperature on {selected} ({temp_unit})",
+        title=f"Hourly Temperature on {selected} ({labels['temp']})",
         height=400,
         margin=dict(t=50, b=20, l=40, r=20),
     )
@@ -671,138 +841,225 @@ def update_hourly_graphs(selected_date, unit_system):
     return dbc.Row([dbc.Col(dcc.Graph(figure=fig), md=12)])
 
 
+# Shared layout settings; figures only add their own titles and y-axis
+_TREND_LAYOUT = {
+    "xaxis": {"title": {"text": "Date"}},
+    "hovermode": "x unified",
+    "template": "ggplot2",
+    "height": 400,
+    "margin": {"t": 50, "b": 20, "l": 40, "r": 20},
+    "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "right", "x": 1},
+}
+# Markers are only drawn on short ranges; on long ones they dominate render time
+_TREND_MARKER_MAX_POINTS = 90
+# Beyond this many points the trend traces are drawn with WebGL instead of SVG
+_TREND_WEBGL_MIN_POINTS = 200
+# Vertical line marking the selected date; x0/x1 are filled in per call
+_SELECTED_DATE_LINE = {
+    "type": "line",
+    "xref": "x",
+    "yref": "y domain",
+    "y0": 0,
+    "y1": 1,
+    "line": {"color": "green", "width": 2, "dash": "dash"},
+}
+_BOX_LAYOUT = {
+    "height": 300,
+    "yaxis": {"hoverformat": ".2f"},
+    "margin": {"t": 50, "b": 20, "l": 40, "r": 20},
+    "template": "plotly_dark",
+}
+
+
+def _daily_frame_to_store(daily_dataframe):
+    """
+    Serialize a daily frame for the daily-data-store.
+
+    The frame is stored as base64-encoded Feather (Arrow IPC) bytes, which
+    keep column dtypes and decode much faster than JSON.
+    """
+    buffer = io.BytesIO()
+    daily_dataframe.reset_index(drop=True).to_feather(buffer)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _daily_frame_from_store(payload):
+    """Rebuild the day-indexed daily frame from a daily-data-store payload."""
+    daily_dataframe = pd.read_feather(io.BytesIO(base64.b64decode(payload)))
+    return _index_by_day(daily_dataframe)
+
+
+@cache.memoize(timeout=600)
+def _build_trend_figures(payload, unit_system):
+    """
+    Build the temperature, wind and humidity trend charts for a unit system.
+
+    The charts only depend on the daily data, not on the selected date, so
+    they are memoized on the daily-data-store payload as plain figure dicts.
+
+    Args:
+        payload (str): Serialized daily data from the daily-data-store
+        unit_system (str): Unit system ('imperial' or 'metric')
+
+    Returns:
+        tuple: (figure dicts keyed by "temp", "wind" and "humidity",
+            ISO dates that have data)
+    """
+    import plotly.graph_objects as go
+
+    daily_dataframe = _daily_frame_from_store(payload)
+    labels = LABELS[unit_system]
+
+    # Hand plotly plain rounded arrays; Series get copied during validation.
+    # Each plotted column is converted once, up front.
+    dates = daily_dataframe["date"].to_numpy()
+    columns = (
+        "temperature_2m_max", "temperature_2m_min", "temperature_2m_mean",
+        "wind_speed_10m_max", "wind_speed_10m_mean", "wind_speed_10m_min",
+        "relative_humidity_2m_max", "relative_humidity_2m_mean", "relative_humidity_2m_min",
+    )
+    arrays = {column: _display_values(daily_dataframe[column]) for column in columns}
+
+    # Validate the shared layout (expanding its template) once; the three
+    # figures are then plain dicts that differ only in traces and y-axis
+    base_layout = go.Figure(layout=_TREND_LAYOUT).to_dict()["layout"]
+    mode = "lines+markers" if len(dates) <= _TREND_MARKER_MAX_POINTS else "lines"
+    trace_type = "scattergl" if len(dates) > _TREND_WEBGL_MIN_POINTS else "scatter"
+
+    def trend_figure(traces, yaxis_title):
+        return {
+            "data": [
+                {
+                    "type": trace_type,
+                    "x": dates,
+                    "y": arrays[column],
+                    "mode": mode,
+                    "name": name,
+                    "line": line,
+                }
+                for column, name, line in traces
+            ],
+            "layout": {
+                **base_layout,
+                "yaxis": {"title": {"text": yaxis_title}, "hoverformat": ".2f"},
+            },
+        }
+
+    # --- Temperature Trend Chart ---
+    temp_fig = trend_figure(
+        [
+            ("temperature_2m_max", "Max Temp", {"color": "red"}),
+            ("temperature_2m_min", "Min Temp", {"color": "blue"}),
+            ("temperature_2m_mean", "Mean Temp", {"color": "purple", "dash": "dot"}),
+        ],
+        labels["temp_axis"],
+    )
+
+    # --- Wind Speed Trend Chart ---
+    wind_fig = trend_figure(
+        [
+            ("wind_speed_10m_max", "Max Wind", {"color": "orange"}),
+            ("wind_speed_10m_mean", "Mean Wind", {"color": "green", "dash": "dot"}),
+            ("wind_speed_10m_min", "Min Wind", {"color": "teal"}),
+        ],
+        labels["wind_axis"],
+    )
+
+    # --- Humidity Trend Chart ---
+    humidity_fig = trend_figure(
+        [
+            ("relative_humidity_2m_max", "Max Humidity", {"color": "darkred"}),
+            ("relative_humidity_2m_mean", "Mean Humidity", {"color": "darkblue", "dash": "dot"}),
+            ("relative_humidity_2m_min", "Min Humidity", {"color": "darkgreen"}),
+        ],
+        "Relative Humidity (%)",
+    )
+
+    figures = {"temp": temp_fig, "wind": wind_fig, "humidity": humidity_fig}
+    return figures, {day.isoformat() for day in daily_dataframe.index}
+
+
+def _with_shapes(fig_dict, shapes):
+    """Return a shallow copy of a cached trend figure with the given layout shapes."""
+    return {"data": fig_dict["data"], "layout": dict(fig_dict["layout"], shapes=shapes)}
+
+
 @app.callback(
-    [Output('daily-summary-cards', 'children'),
-     Output('temp-trend-chart', 'figure'),
-     Output('wind-trend-chart', 'figure'),
-     Output('humidity-trend-chart', 'figure'),
-     Output('boxplot-temp-max', 'figure'),
-     Output('boxplot-temp-min', 'figure'),
-     Output('boxplot-temp-mean', 'figure')],
+    Output('daily-data-store', 'data'),
+    Input('unit-system-store', 'data')
+)
+def update_daily_store(unit_system):
+    """
+    Load the daily data for the selected unit system into the shared store.
+
+    Args:
+        unit_system (str): The selected unit system ('imperial' or 'metric')
+
+    Returns:
+        str: Serialized daily data
+    """
+    daily_dataframe, _ = get_cached_frames(unit_system)
+    return _daily_frame_to_store(daily_dataframe)
+
+
+@app.callback(
+    Output('daily-summary-cards', 'children'),
     [Input('date-picker-daily', 'date'),
-     Input('unit-system-store', 'data')]
+     Input('daily-data-store', 'data')],
+    [State('unit-system-store', 'data')]
 )
-def update_dashboard(selected_date_str, unit_system):
+def update_summary_cards(selected_date_str, payload, unit_system):
     """
-    Update all dashboard components when a new date is selected or unit system changes.
+    Update the summary cards when a new date is selected or new data arrives.
     """
-    global daily_dataframe, hourly_dataframe
-    
-    # Check if we need to load or fetch new data
-    if not os.path.exists(f"{unit_system}_daily_data_{today}.csv") or not os.path.exists(f"{unit_system}_hourly_data_{today}.csv"):
-        print(f"Fetching data for {unit_system} units...")
-        daily_dataframe, hourly_dataframe = get_weather_data(unit_system=unit_system)
-        cleanup_old_data_files()
-    else:
-        print(f"Loading {unit_system} data from cache...")
-        daily_dataframe = pd.read_csv(f"{unit_system}_daily_data_{today}.csv")
-        daily_dataframe["date"] = pd.to_datetime(daily_dataframe["date"]).dt.date
-        hourly_dataframe = pd.read_csv(f"{unit_system}_hourly_data_{today}.csv")
-        hourly_dataframe["date"] = pd.to_datetime(hourly_dataframe["date"])
+    if payload is None:
+        raise PreventUpdate
 
-    # Get unit labels based on unit system
-    temp_unit = "°F" if unit_system == "imperial" else "°C"
-    wind_unit = "mph" if unit_system == "imperial" else "km/h"
-    precip_unit = "in" if unit_system == "imperial" else "mm"
+    daily_dataframe = _daily_frame_from_store(payload)
+    labels = LABELS[unit_system]
 
     # Convert the selected date string to a date object
     selected_date = pd.to_datetime(selected_date_str).date()
 
-    # Filter for the selected day's summary
-    selected_day_data = daily_dataframe[daily_dataframe["date"] == selected_date]
+    # Look up the selected day's summary row by its date index
+    try:
+        data_row = daily_dataframe.loc[selected_date]
+    except KeyError:
+        data_row = None
 
-    # --- Daily Summary Cards ---
     summary_cards_children = []
     
-    if not selected_day_data.empty:
-        data_row = selected_day_data.iloc[0]
-
-        # --- KPI Variables ---
-        max_temp = data_row["temperature_2m_max"]
-        max_wind = data_row["wind_speed_10m_max"]
-        mean_humidity = data_row["relative_humidity_2m_mean"]
+    if data_row is not None:
+        # --- KPI Variables (one indexer call for all three) ---
+        max_temp, max_wind, mean_humidity = data_row[
+            ["temperature_2m_max", "wind_speed_10m_max", "relative_humidity_2m_mean"]
+        ].to_numpy()
+
+        # (label, icon, value, card color) for each card
+        card_spec = [
+            (labels["max_temp"], "bi bi-cloud-fill", max_temp, "dark"),
+            (labels["max_wind"], "bi bi-wind", max_wind, "info"),
+            ("Mean Humidity (%)", "bi bi-moisture", mean_humidity, "danger"),
+        ]
+        cards = [
+            dbc.Col(
+                dbc.Card(
+                    [
+                        dbc.CardHeader([html.I(className=f"{icon} me-2"), label]),
+                        dbc.CardBody(
+                            html.H2(f"{value:.2f}", className="card-text text-center")
+                        ),
+                    ],
+                    color=color,
+                    inverse=True,
+                    className="shadow-sm rounded-3 mb-3",
+                )
+            )
+            for label, icon, value, color in card_spec
+        ]
 
         summary_cards_children = [
-            html.Div(
-                className="text-center",
-                children=[
-                    dbc.Row(
-                        [
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            [
-                                                html.I(
-                                                    className="bi bi-cloud-fill me-2"
-                                                ),
-                                                f"Max Temp ({temp_unit})",
-                                            ]
-                                        ),
-                                        dbc.CardBody(
-                                            [
-                                                html.H2(
-                                                    f"{max_temp:.2f}",
-                                                    className="card-text text-center",
-                                                )
-                                            ]
-                                        ),
-                                    ],
-                                    color="dark",
-                                    inverse=True,
-                                    className="shadow-sm rounded-3 mb-3",
-                                )
-                            ),
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            [
-                                                html.I(className="bi bi-wind me-2"),
-                                                f"Max Wind ({wind_unit})",
-                                            ]
-                                        ),
-                                        dbc.CardBody(
-                                            [
-                                                html.H2(
-                                                    f"{max_wind:.2f}",
-                                                    className="card-text text-center",
-                                                )
-                                            ]
-                                        ),
-                                    ],
-                                    color="info",
-                                    inverse=True,
-                                    className="shadow-sm rounded-3 mb-3",
-                                )
-                            ),
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            [
-                                                html.I(className="bi bi-moisture me-2"),
-                                                "Mean Humidity (%)",
-                                            ]
-                                        ),
-                                        dbc.CardBody(
-                                            [
-                                                html.H2(
-                                                    f"{mean_humidity:.2f}",
-                                                    className="card-text text-center",
-                                                )
-                                            ]
-                                        ),
-                                    ],
-                                    color="danger",
-                                    inverse=True,
-                                    className="shadow-sm rounded-3 mb-3",
-                                )
-                            ),
-                        ]
-                    ),
-                ],
-            )
+            html.Div(className="text-center", children=[dbc.Row(cards)])
         ]
     else:
         summary_cards_children = html.P(
@@ -810,221 +1067,163 @@ def update_dashboard(selected_date_str, unit_system):
             style={"textAlign": "center", "color": "#888", "fontSize": "1.2em"},
         )
 
-    # --- Temperature Trend Chart ---
-    temp_fig = go.Figure()
-    temp_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["temperature_2m_max"],
-            mode="lines+markers",
-            name="Max Temp",
-            line=dict(color="red"),
-        )
-    )
-    temp_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["temperature_2m_min"],
-            mode="lines+markers",
-            name="Min Temp",
-            line=dict(color="blue"),
-        )
-    )
-    temp_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["temperature_2m_mean"],
-            mode="lines+markers",
-            name="Mean Temp",
-            line=dict(color="purple", dash="dot"),
-        )
-    )
+    return summary_cards_children
 
-    # Highlight selected date
-    if not selected_day_data.empty:
-        temp_fig.add_vline(
-            x=selected_date,
-            line_width=2,
-            line_dash="dash",
-            line_color="green",
-        )
 
-    temp_fig.update_layout(
-        xaxis_title="Date",
-        yaxis_title=f"Temperature ({temp_unit})",
-        hovermode="x unified",
-        template="ggplot2",
-        height=400,
-        margin=dict(t=50, b=20, l=40, r=20),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
+@app.callback(
+    [Output('temp-trend-chart', 'figure'),
+     Output('wind-trend-chart', 'figure'),
+     Output('humidity-trend-chart', 'figure')],
+    [Input('date-picker-daily', 'date'),
+     Input('daily-data-store', 'data')],
+    [State('unit-system-store', 'data')]
+)
+def update_trend_charts(selected_date_str, payload, unit_system):
+    """
+    Update the trend charts when a new date is selected or new data arrives.
 
-    # --- Wind Speed Trend Chart ---
-    wind_fig = go.Figure()
-    wind_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["wind_speed_10m_max"],
-            mode="lines+markers",
-            name="Max Wind",
-            line=dict(color="orange"),
-        )
-    )
-    wind_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["wind_speed_10m_mean"],
-            mode="lines+markers",
-            name="Mean Wind",
-            line=dict(color="green", dash="dot"),
-        )
-    )
-    wind_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["wind_speed_10m_min"],
-            mode="lines+markers",
-            name="Min Wind",
-            line=dict(color="teal"),
-        )
-    )
+    A date change only moves the selected-date marker, so it is sent as a
+    patch of each chart's layout shapes; new data sends full figures.
+    """
+    if payload is None:
+        raise PreventUpdate
 
-    # Highlight selected date
-    if not selected_day_data.empty:
-        wind_fig.add_vline(
-            x=selected_date,
-            line_width=2,
-            line_dash="dash",
-            line_color="green",
-        )
+    selected_date = pd.to_datetime(selected_date_str).date()
+    # A date change and a new store can arrive in the same call; only a
+    # call without new data (and not the initial call) may patch the figures
+    triggered = ctx.triggered_prop_ids
+    date_changed = bool(triggered) and 'daily-data-store.data' not in triggered
+
+    if date_changed:
+        # Only the marker moves, so check the day against the payload itself
+        # instead of loading the cached figures
+        has_data = selected_date in _daily_frame_from_store(payload).index
+    else:
+        trend_figs, data_days = _build_trend_figures(payload, unit_system)
+        has_data = selected_date.isoformat() in data_days
 
-    wind_fig.update_layout(
-        xaxis_title="Date",
-        yaxis_title=f"Wind Speed ({wind_unit})",
-        hovermode="x unified",
-        template="ggplot2",
-        height=400,
-        margin=dict(t=50, b=20, l=40, r=20),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
+    # Highlight selected date with one shape shared by all three charts
+    if has_data:
+        shapes = [dict(_SELECTED_DATE_LINE, x0=selected_date, x1=selected_date)]
+    else:
+        shapes = []
 
-    # --- Humidity Trend Chart ---
-    humidity_fig = go.Figure()
-    humidity_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["relative_humidity_2m_max"],
-            mode="lines+markers",
-            name="Max Humidity",
-            line=dict(color="darkred"),
-        )
-    )
-    humidity_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["relative_humidity_2m_mean"],
-            mode="lines+markers",
-            name="Mean Humidity",
-            line=dict(color="darkblue", dash="dot"),
-        )
-    )
-    humidity_fig.add_trace(
-        go.Scatter(
-            x=daily_dataframe["date"],
-            y=daily_dataframe["relative_humidity_2m_min"],
-            mode="lines+markers",
-            name="Min Humidity",
-            line=dict(color="darkgreen"),
-        )
+    if date_changed:
+        patches = []
+        for _ in range(3):
+            patch = Patch()
+            patch["layout"]["shapes"] = shapes
+            patches.append(patch)
+        return tuple(patches)
+
+    return (
+        _with_shapes(trend_figs["temp"], shapes),
+        _with_shapes(trend_figs["wind"], shapes),
+        _with_shapes(trend_figs["humidity"], shapes),
     )
 
-    # Highlight selected date
-    if not selected_day_data.empty:
-        humidity_fig.add_vline(
-            x=selected_date,
-            line_width=2,
-            line_dash="dash",
-            line_color="green",
-        )
 
-    humidity_fig.update_layout(
-        xaxis_title="Date",
-        yaxis_title="Relative Humidity (%)",
-        hovermode="x unified",
-        template="ggplot2",
-        height=400,
-        margin=dict(t=50, b=20, l=40, r=20),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
+@cache.memoize(timeout=600)
+def _build_box_figures(payload, unit_system):
+    """
+    Build the max, min and mean temperature box plots for a unit system.
 
-    # --- Box Plots ---
-    box_temp_max = go.Figure()
-    box_temp_max.add_trace(
-        go.Box(y=daily_dataframe["temperature_2m_max"], name=f"Temp Max ({temp_unit})")
-    )
-    box_temp_max.update_layout(
-        title=f"Temperature Max ({temp_unit})",
-        height=300,
-        margin=dict(t=50, b=20, l=40, r=20),
-        template="plotly_dark",
-    )
+    Like the trend charts, they only depend on the daily data, so they are
+    memoized on the daily-data-store payload as plain figure dicts.
 
-    box_temp_min = go.Figure()
-    box_temp_min.add_trace(
-        go.Box(y=daily_dataframe["temperature_2m_min"], name=f"Temp Min ({temp_unit})")
-    )
-    box_temp_min.update_layout(
-        title=f"Temperature Min ({temp_unit})",
-        height=300,
-        margin=dict(t=50, b=20, l=40, r=20),
-        template="plotly_dark",
-    )
+    Args:
+        payload (str): Serialized daily data from the daily-data-store
+        unit_system (str): Unit system ('imperial' or 'metric')
 
-    box_temp_mean = go.Figure()
-    box_temp_mean.add_trace(
-        go.Box(y=daily_dataframe["temperature_2m_mean"], name=f"Temp Mean ({temp_unit})")
-    )
-    box_temp_mean.update_layout(
-        title=f"Temperature Mean ({temp_unit})",
-        height=300,
-        margin=dict(t=50, b=20, l=40, r=20),
-        template="plotly_dark",
-    )
+    Returns:
+        tuple: Figure dicts for the max, min and mean box plots
+    """
+    import plotly.graph_objects as go
+
+    daily_dataframe = _daily_frame_from_store(payload)
+    temp_unit = LABELS[unit_system]["temp"]
+    columns = ("temperature_2m_max", "temperature_2m_min", "temperature_2m_mean")
+    arrays = {column: _display_values(daily_dataframe[column]) for column in columns}
+
+    def box_figure(column, label):
+        # Each figure is validated once, from a single dict
+        return go.Figure(
+            {
+                "data": [
+                    {
+                        "type": "box",
+                        "y": arrays[column],
+                        "name": f"Temp {label} ({temp_unit})",
+                    }
+                ],
+                "layout": {
+                    **_BOX_LAYOUT,
+                    "title": {"text": f"Temperature {label} ({temp_unit})"},
+                },
+            }
+        ).to_dict()
 
     return (
-        summary_cards_children,
-        temp_fig,
-        wind_fig,
-        humidity_fig,
-        box_temp_max,
-        box_temp_min,
-        box_temp_mean,
+        box_figure("temperature_2m_max", "Max"),
+        box_figure("temperature_2m_min", "Min"),
+        box_figure("temperature_2m_mean", "Mean"),
     )
 
-# Add new callback for unit system change
+
 @app.callback(
+    [Output('boxplot-temp-max', 'figure'),
+     Output('boxplot-temp-min', 'figure'),
+     Output('boxplot-temp-mean', 'figure')],
+    [Input('daily-data-store', 'data')],
+    [State('unit-system-store', 'data')]
+)
+def update_box_plots(payload, unit_system):
+    """
+    Update the temperature box plots when new data arrives.
+
+    The box plots don't depend on the selected date, so date changes
+    never rebuild them.
+    """
+    if payload is None:
+        raise PreventUpdate
+
+    return _build_box_figures(payload, unit_system)
+
+# Add new callback for unit system change.
+# Runs in the browser: the store simply mirrors the selector.
+app.clientside_callback(
+    """
+    function(selectedUnit) {
+        return selectedUnit;
+    }
+    """,
     Output('unit-system-store', 'data'),
     Input('unit-system-selector', 'value')
 )
-def update_unit_system(selected_unit):
-    """Update unit system and trigger data refresh"""
-    return selected_unit
 
-# Add new callback to update section titles
-@app.callback(
+# Add new callback to update section titles, also in the browser
+app.clientside_callback(
+    """
+    function(unitSystem) {
+        var tempUnit = unitSystem === "imperial" ? "°F" : "°C";
+        var windUnit = unitSystem === "imperial" ? "mph" : "km/h";
+        return [
+            "Daily Temperature Trends (" + tempUnit + ")",
+            "Daily Wind Speed Trends (" + windUnit + ")"
+        ];
+    }
+    """,
     [Output("temp-trend-title", "children"),
      Output("wind-trend-title", "children")],
     Input("unit-system-store", "data")
 )
-def update_section_titles(unit_system):
-    """Update section titles with correct units"""
-    temp_unit = "°F" if unit_system == "imperial" else "°C"
-    wind_unit = "mph" if unit_system == "imperial" else "km/h"
-    return [
-        f"Daily Temperature Trends ({temp_unit})",
-        f"Daily Wind Speed Trends ({wind_unit})"
-    ]
 
 # --- 5. Run the Dash Application ---
+# Debug mode (reloader and dev tools) is opt-in via DASH_DEBUG=1; in
+# production the app is served by gunicorn through `server`
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run(
+        debug=os.getenv("DASH_DEBUG") == "1",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8050)),
+    )